@@ -15,119 +15,328 @@
 """Configuration management for LLM settings."""
 
 import dataclasses
+import functools
 import json
+import operator
 import os
-from typing import Any, Mapping
+import sys
+import threading
+import time
+from typing import Any, Callable
 
+from absl import logging
 
-@dataclasses.dataclass
+_json_loads: Callable[[bytes], Any]
+try:
+  import orjson  # pylint: disable=g-import-not-at-top
+
+  _json_loads = orjson.loads
+except ImportError:
+  _json_loads = json.loads
+
+# Names of the provider fields in `Config`, interned so lookups keyed on them
+# compare by identity.
+_PROVIDERS = tuple(
+    sys.intern(provider)
+    for provider in ("openai", "anthropic", "gemini", "together", "xai")
+)
+
+# Maps API key environment variables to the `Config` field of their provider.
+_ENV_TO_PROVIDER = {
+    sys.intern(env_var): sys.intern(provider)
+    for env_var, provider in (
+        ("OPENAI_API_KEY", "openai"),
+        ("ANTHROPIC_API_KEY", "anthropic"),
+        ("GOOGLE_API_KEY", "gemini"),
+        ("TOGETHER_API_KEY", "together"),
+        ("XAI_API_KEY", "xai"),
+    )
+}
+
+# Snapshot of the API key environment variables, refreshed by
+# `invalidate_env_cache()`. Variables unset in the snapshot are still looked up
+# in `os.environ`.
+_ENV_CACHE: dict[str, str | None] = {
+    env_var: os.environ.get(env_var) for env_var in _ENV_TO_PROVIDER
+}
+
+# Default config locations that do not depend on the working directory.
+_HOME = os.path.expanduser("~")
+_USER_DEFAULT = os.path.join(_HOME, ".game_arena_config.json")
+_REPO_DEFAULT = os.path.normpath(
+    os.path.join(
+        os.path.dirname(__file__), "..", "..", "game_arena_config.json"
+    )
+)
+
+# How long a resolved default config location is trusted before re-probing.
+_DEFAULT_PATH_TTL_SECONDS = 5.0
+
+# Maps the working directory to the default config path found from it (or None)
+# and the `time.monotonic()` time it was probed.
+_default_path_cache: dict[str, tuple[str | None, float]] = {}
+
+# Config paths that already logged a load failure.
+_warned_config_paths: set[str] = set()
+
+
+def invalidate_env_cache() -> None:
+  """Re-reads the cached API key environment variables.
+
+  Call this after changing an API key environment variable that was already set
+  when the snapshot was taken.
+  """
+  _ENV_CACHE.update(
+      {env_var: os.environ.get(env_var) for env_var in _ENV_TO_PROVIDER}
+  )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class LLMConfig:
   """Configuration for a specific LLM provider."""
+
   api_key: str | None = None
   base_url: str | None = None
 
 
-@dataclasses.dataclass
+# Shared default for providers without settings. Safe to share since
+# `LLMConfig` is immutable.
+_EMPTY_LLM = LLMConfig()
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Config:
-  """Main configuration class for all LLM providers."""
-  openai: LLMConfig = dataclasses.field(default_factory=LLMConfig)
-  anthropic: LLMConfig = dataclasses.field(default_factory=LLMConfig)
-  gemini: LLMConfig = dataclasses.field(default_factory=LLMConfig)
-  together: LLMConfig = dataclasses.field(default_factory=LLMConfig)
-  xai: LLMConfig = dataclasses.field(default_factory=LLMConfig)
+  """Main configuration class for all LLM providers.
+
+  Configs are immutable, so loaded and default configs can be shared between
+  callers. Use `dataclasses.replace` to derive a modified config.
+  """
+
+  openai: LLMConfig = _EMPTY_LLM
+  anthropic: LLMConfig = _EMPTY_LLM
+  gemini: LLMConfig = _EMPTY_LLM
+  together: LLMConfig = _EMPTY_LLM
+  xai: LLMConfig = _EMPTY_LLM
+
+
+def _llm_config_from_data(provider: str, provider_data: Any) -> LLMConfig:
+  """Returns the `LLMConfig` for one provider's block of the config file."""
+  if provider_data is None:
+    return _EMPTY_LLM
+  if not isinstance(provider_data, dict):
+    raise ValueError(f"{provider!r} config must be a JSON object")
+  api_key = provider_data.get("api_key")
+  base_url = provider_data.get("base_url")
+  if api_key is None and base_url is None:
+    return _EMPTY_LLM  # Keep the shared empty default.
+  return LLMConfig(api_key=api_key, base_url=base_url)
+
+
+@functools.lru_cache(maxsize=8)
+def _config_from_bytes(raw_config: bytes) -> Config:
+  """Parses raw config file contents, memoized on the contents themselves.
+
+  Uses `orjson` when it is installed, and the standard `json` module otherwise.
+
+  Args:
+    raw_config: Contents of a JSON config file.
+
+  Returns:
+    Config object with loaded settings.
+  """
+  config_data = _json_loads(raw_config)
+  if not isinstance(config_data, dict):
+    raise ValueError("config must be a JSON object")
+
+  # Convert dict to Config object, leaving absent providers at the default.
+  # `_PROVIDERS` matches the field order of `Config`.
+  return Config(*(
+      _llm_config_from_data(provider, config_data.get(provider))
+      for provider in _PROVIDERS
+  ))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Config:
+  """Loads the config file at `config_path`.
+
+  Results are memoized on the resolved path and modification time, so a config
+  file is only re-read once it changes on disk.
+
+  Args:
+    config_path: Absolute path to the config file.
+    mtime_ns: Modification time of the file, only used as part of the cache key.
+
+  Returns:
+    Config object with loaded settings.
+  """
+  del mtime_ns  # Only part of the cache key.
+  with open(config_path, "rb") as f:
+    return _config_from_bytes(f.read())
+
+
+def _find_default_config() -> tuple[str, os.stat_result] | None:
+  """Returns the first existing default config path and its stat result.
+
+  Each candidate is checked with a single `os.stat` call whose result is reused
+  by the caller. The location found is cached per working directory for
+  `_DEFAULT_PATH_TTL_SECONDS`.
+
+  Returns:
+    A `(path, stat_result)` tuple, or None if no default config file exists.
+  """
+  cwd = os.getcwd()
+  now = time.monotonic()
+  cached = _default_path_cache.get(cwd)
+  if cached is not None and now - cached[1] < _DEFAULT_PATH_TTL_SECONDS:
+    if cached[0] is None:
+      return None
+    try:
+      return cached[0], os.stat(cached[0])
+    except OSError:
+      pass  # Removed since it was found, probe again.
+
+  default_paths = [
+      _USER_DEFAULT,
+      os.path.join(cwd, "game_arena_config.json"),
+      _REPO_DEFAULT,
+  ]
+  for path in default_paths:
+    try:
+      path_stat = os.stat(path)
+    except OSError:
+      continue
+    _default_path_cache[cwd] = (path, now)
+    return path, path_stat
+  _default_path_cache[cwd] = (None, now)
+  return None
 
 
 def load_config(config_path: str | None = None) -> Config:
   """Load configuration from file or create default config.
-  
+
+  Loaded configs are cached until the file's modification time changes, and
+  the default location found is reused for a few seconds. Failures to load a
+  file are logged once per path. `clear_config_caches()` drops the cached
+  configs, default locations and logged failures; the shared config from
+  `get_default_config()` is only reloaded after `reset_default_config()`.
+
   Args:
     config_path: Path to config file. If None, checks default locations.
-  
+
   Returns:
     Config object with loaded settings.
   """
   if config_path is None:
-    # Check default locations
-    home_dir = os.path.expanduser("~")
-    default_paths = [
-      os.path.join(home_dir, ".game_arena_config.json"),
-      os.path.join(os.getcwd(), "game_arena_config.json"),
-      os.path.join(os.path.dirname(__file__), "..", "..", "game_arena_config.json"),
-    ]
-    
-    for path in default_paths:
-      if os.path.exists(path):
-        config_path = path
-        break
-    else:
+    default_config = _find_default_config()
+    if default_config is None:
       # No config file found, return default config
       return Config()
-  
+    config_path, config_stat = default_config
+  else:
+    config_path = os.path.abspath(config_path)
+    config_stat = None
+
   try:
-    with open(config_path, "r") as f:
-      config_data = json.load(f)
-    
-    # Convert dict to Config object
-    llm_configs = {}
-    for provider in ["openai", "anthropic", "gemini", "together", "xai"]:
-      if provider in config_data:
-        provider_data = config_data[provider]
-        llm_configs[provider] = LLMConfig(
-          api_key=provider_data.get("api_key"),
-          base_url=provider_data.get("base_url")
-        )
-      else:
-        llm_configs[provider] = LLMConfig()
-    
-    return Config(
-      openai=llm_configs["openai"],
-      anthropic=llm_configs["anthropic"],
-      gemini=llm_configs["gemini"],
-      together=llm_configs["together"],
-      xai=llm_configs["xai"]
-    )
-  except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-    print(f"Warning: Could not load config from {config_path}: {e}")
+    if config_stat is None:
+      config_stat = os.stat(config_path)
+    return _load_config_cached(config_path, config_stat.st_mtime_ns)
+  except (OSError, ValueError) as e:
+    if config_path not in _warned_config_paths:
+      _warned_config_paths.add(config_path)
+      logging.warning("Could not load config from %s: %s", config_path, e)
     return Config()
 
 
+def clear_config_caches() -> None:
+  """Drops cached config files, default config locations and warnings."""
+  _load_config_cached.cache_clear()
+  _config_from_bytes.cache_clear()
+  _default_path_cache.clear()
+  _warned_config_paths.clear()
+
+
+# Config loaded from the default locations, shared by all callers that do not
+# pass their own. Built on first use by `get_default_config()`.
+_DEFAULT_CONFIG: Config | None = None
+_DEFAULT_CONFIG_LOCK = threading.Lock()
+
+
+def get_default_config() -> Config:
+  """Returns the config loaded from the default locations.
+
+  The config is loaded once per process and shared. Use
+  `reset_default_config()` to load it again.
+  """
+  global _DEFAULT_CONFIG
+  if _DEFAULT_CONFIG is None:
+    with _DEFAULT_CONFIG_LOCK:
+      if _DEFAULT_CONFIG is None:
+        _DEFAULT_CONFIG = load_config()
+  return _DEFAULT_CONFIG
+
+
+def reset_default_config() -> None:
+  """Drops the shared default config so the next use reloads it."""
+  global _DEFAULT_CONFIG
+  with _DEFAULT_CONFIG_LOCK:
+    _DEFAULT_CONFIG = None
+
+
+_ApiKeyResolver = Callable[[str | None, Config | None], str | None]
+
+
+def _make_api_key_resolver(env_var: str, provider: str) -> _ApiKeyResolver:
+  """Returns `get_api_key_with_fallback` specialized for one provider."""
+  get_llm_config = operator.attrgetter(provider)
+
+  def resolve(config_key: str | None, config: Config | None) -> str | None:
+    if config_key is not None:
+      return config_key
+    if config is None:
+      # Read the environment once and reuse it if the default config has no key.
+      env_api_key = _ENV_CACHE[env_var] or os.environ.get(env_var)
+      if env_api_key:
+        return env_api_key
+      return get_llm_config(get_default_config()).api_key or env_api_key
+    return (
+        get_llm_config(config).api_key
+        or _ENV_CACHE[env_var]
+        or os.environ.get(env_var)
+    )
+
+  return resolve
+
+
+# API key resolvers for each known environment variable, built at import.
+_API_KEY_RESOLVERS: dict[str, _ApiKeyResolver] = {
+    env_var: _make_api_key_resolver(env_var, provider)
+    for env_var, provider in _ENV_TO_PROVIDER.items()
+}
+
+
 def get_api_key_with_fallback(
-    config_key: str | None,
-    env_var: str,
-    config: Config | None = None
+    config_key: str | None, env_var: str, config: Config | None = None
 ) -> str | None:
   """Get API key from config or environment variable.
-  
+
+  When `config` is passed, its key takes precedence over the environment
+  variable. Otherwise a set environment variable is returned without loading
+  the default config.
+
   Args:
     config_key: API key from config
     env_var: Environment variable name
-    config: Config object (will load if None)
-  
+    config: Config object (uses `get_default_config()` if None)
+
   Returns:
     API key string or None if not found
   """
+  resolver = _API_KEY_RESOLVERS.get(env_var)
+  if resolver is not None:
+    return resolver(config_key, config)
+
+  # No provider uses this variable, so only the environment can supply it.
   if config_key is not None:
     return config_key
-  
-  if config is None:
-    config = load_config()
-  
-  # Check config first, then environment
-  if hasattr(config, "openai") and env_var == "OPENAI_API_KEY":
-    if config.openai.api_key:
-      return config.openai.api_key
-  elif hasattr(config, "anthropic") and env_var == "ANTHROPIC_API_KEY":
-    if config.anthropic.api_key:
-      return config.anthropic.api_key
-  elif hasattr(config, "gemini") and env_var == "GOOGLE_API_KEY":
-    if config.gemini.api_key:
-      return config.gemini.api_key
-  elif hasattr(config, "together") and env_var == "TOGETHER_API_KEY":
-    if config.together.api_key:
-      return config.together.api_key
-  elif hasattr(config, "xai") and env_var == "XAI_API_KEY":
-    if config.xai.api_key:
-      return config.xai.api_key
-  
-  # Fallback to environment variable
-  return os.environ.get(env_var)
\ No newline at end of file
+  return os.environ.get(env_var)
@@ -12,16 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
 import json
 import os
 import tempfile
 from unittest import mock
 
 from absl.testing import absltest
+from absl.testing import parameterized
 from game_arena.harness import config
 
 
-class ConfigTest(absltest.TestCase):
+class ConfigTest(parameterized.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    config.clear_config_caches()
+    config.reset_default_config()
+    self.addCleanup(config.reset_default_config)
+    config.invalidate_env_cache()
+    self.addCleanup(config.invalidate_env_cache)
 
   def test_llm_config_default_values(self):
     """Test LLMConfig has correct default values."""
@@ -46,6 +56,36 @@ class ConfigTest(absltest.TestCase):
     self.assertIsNone(cfg.openai.api_key)
     self.assertIsNone(cfg.openai.base_url)
 
+  def test_config_shares_empty_provider_default(self):
+    """Test unset providers share a single immutable LLMConfig."""
+    cfg = config.Config()
+    self.assertIs(cfg.openai, cfg.anthropic)
+    self.assertIs(cfg.openai, config.Config().openai)
+    with self.assertRaises(dataclasses.FrozenInstanceError):
+      setattr(cfg.openai, "api_key", "key")
+
+  def test_config_replace(self):
+    """Test dataclasses.replace derives a modified config."""
+    cfg = config.Config()
+    updated = dataclasses.replace(
+        cfg, openai=config.LLMConfig(api_key="openai_key")
+    )
+    self.assertEqual(updated.openai.api_key, "openai_key")
+    self.assertIsNone(cfg.openai.api_key)
+    self.assertIs(updated.anthropic, cfg.anthropic)
+
+  def test_providers_match_config_field_order(self):
+    """Test the loader's provider order matches Config's positional fields."""
+    self.assertEqual(
+        tuple(field.name for field in dataclasses.fields(config.Config)),
+        config._PROVIDERS,
+    )
+
+  def test_config_classes_use_slots(self):
+    """Test config instances do not carry a per-instance __dict__."""
+    self.assertFalse(hasattr(config.LLMConfig(), "__dict__"))
+    self.assertFalse(hasattr(config.Config(), "__dict__"))
+
   def test_load_config_no_file(self):
     """Test load_config returns default config when no file exists."""
     cfg = config.load_config("/nonexistent/path.json")
@@ -81,6 +121,26 @@ class ConfigTest(absltest.TestCase):
     finally:
       os.unlink(temp_path)
 
+  def test_load_config_shares_default_for_unset_providers(self):
+    """Test providers without api_key or base_url reuse the empty default."""
+    config_data = {
+        "openai": {"api_key": "openai_key"},
+        "gemini": {"comment": "no settings"},
+    }
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+      json.dump(config_data, f)
+      temp_path = f.name
+
+    try:
+      cfg = config.load_config(temp_path)
+      default_llm_config = config.Config().openai
+      self.assertIsNot(cfg.openai, default_llm_config)
+      self.assertIs(cfg.gemini, default_llm_config)
+      self.assertIs(cfg.anthropic, default_llm_config)
+    finally:
+      os.unlink(temp_path)
+
   def test_load_config_with_invalid_json(self):
     """Test load_config handles invalid JSON gracefully."""
     with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
@@ -88,12 +148,67 @@ class ConfigTest(absltest.TestCase):
       temp_path = f.name
     
     try:
-      with mock.patch('builtins.print') as mock_print:
+      with mock.patch.object(config.logging, 'warning') as mock_warning:
         cfg = config.load_config(temp_path)
         self.assertIsInstance(cfg, config.Config)
         self.assertIsNone(cfg.openai.api_key)
-        mock_print.assert_called_once()
-        self.assertIn("Could not load config", mock_print.call_args[0][0])
+        mock_warning.assert_called_once()
+        self.assertIn("Could not load config", mock_warning.call_args[0][0])
+
+        # Repeated failures for the same path are not logged again.
+        config.load_config(temp_path)
+        mock_warning.assert_called_once()
+    finally:
+      os.unlink(temp_path)
+
+  def test_load_config_with_unreadable_path(self):
+    """Test load_config handles paths that exist but cannot be read."""
+    with mock.patch.object(config.logging, 'warning') as mock_warning:
+      cfg = config.load_config(tempfile.gettempdir())
+      self.assertIsInstance(cfg, config.Config)
+      self.assertIsNone(cfg.openai.api_key)
+      mock_warning.assert_called_once()
+
+  @parameterized.named_parameters(
+      ('list', []),
+      ('string', "x"),
+  )
+  def test_load_config_with_non_object_top_level(self, contents):
+    """Test load_config rejects valid JSON that is not an object."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+      json.dump(contents, f)
+      temp_path = f.name
+
+    try:
+      with mock.patch.object(config.logging, 'warning') as mock_warning:
+        cfg = config.load_config(temp_path)
+        self.assertIsNone(cfg.openai.api_key)
+        mock_warning.assert_called_once()
+        self.assertIn(
+            "config must be a JSON object", str(mock_warning.call_args[0][2])
+        )
+    finally:
+      os.unlink(temp_path)
+
+  @parameterized.named_parameters(
+      ('string', "not_an_object"),
+      ('empty_string', ""),
+      ('zero', 0),
+      ('false', False),
+      ('empty_list', []),
+  )
+  def test_load_config_with_malformed_provider(self, provider_data):
+    """Test load_config rejects provider entries that are not objects."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+      json.dump({"openai": provider_data}, f)
+      temp_path = f.name
+
+    try:
+      with mock.patch.object(config.logging, 'warning') as mock_warning:
+        cfg = config.load_config(temp_path)
+        self.assertIsNone(cfg.openai.api_key)
+        mock_warning.assert_called_once()
+        self.assertIn("must be a JSON object", str(mock_warning.call_args[0][2]))
     finally:
       os.unlink(temp_path)
 
@@ -119,27 +234,83 @@ class ConfigTest(absltest.TestCase):
 
   def test_load_config_default_paths(self):
     """Test load_config checks default paths when no path provided."""
-    with mock.patch('os.path.exists') as mock_exists:
-      mock_exists.return_value = False
+    with mock.patch('os.stat') as mock_stat:
+      mock_stat.side_effect = FileNotFoundError
       cfg = config.load_config()
       self.assertIsInstance(cfg, config.Config)
       self.assertIsNone(cfg.openai.api_key)
 
-  @mock.patch('os.path.exists')
-  @mock.patch('builtins.open')
-  @mock.patch('json.load')
-  def test_load_config_finds_default_file(self, mock_json_load, mock_open, mock_exists):
+  @mock.patch('os.stat')
+  def test_load_config_finds_default_file(self, mock_stat):
     """Test load_config finds and loads default config file."""
     config_data = {"openai": {"api_key": "default_key"}}
-    mock_json_load.return_value = config_data
+    mock_open = mock.mock_open(read_data=json.dumps(config_data).encode())
     
-    def exists_side_effect(path):
-      return "game_arena_config.json" in path
+    def stat_side_effect(path):
+      if "game_arena_config.json" not in path:
+        raise FileNotFoundError(path)
+      return mock.Mock(st_mtime_ns=1)
     
-    mock_exists.side_effect = exists_side_effect
+    mock_stat.side_effect = stat_side_effect
     
-    cfg = config.load_config()
+    with mock.patch('builtins.open', mock_open):
+      cfg = config.load_config()
     self.assertEqual(cfg.openai.api_key, "default_key")
+    # The probe's stat result is reused as the cache key.
+    self.assertEqual(mock_stat.call_count, 1)
+
+  @mock.patch('time.monotonic')
+  @mock.patch('os.stat')
+  def test_load_config_reuses_default_path_within_ttl(
+      self, mock_stat, mock_monotonic
+  ):
+    """Test default locations are only re-probed once the TTL expires."""
+    mock_stat.side_effect = FileNotFoundError
+    mock_monotonic.return_value = 100.0
+    config.load_config()
+    probes = mock_stat.call_count
+    self.assertGreater(probes, 0)
+
+    mock_monotonic.return_value = 101.0
+    config.load_config()
+    self.assertEqual(mock_stat.call_count, probes)
+
+    mock_monotonic.return_value = 100.0 + config._DEFAULT_PATH_TTL_SECONDS
+    config.load_config()
+    self.assertEqual(mock_stat.call_count, 2 * probes)
+
+  def test_load_config_caches_until_file_changes(self):
+    """Test load_config reuses the parsed config until the file is modified."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+      json.dump({"openai": {"api_key": "first_key"}}, f)
+      temp_path = f.name
+
+    try:
+      cfg = config.load_config(temp_path)
+      self.assertIs(config.load_config(temp_path), cfg)
+
+      with open(temp_path, 'w') as f:
+        json.dump({"openai": {"api_key": "second_key"}}, f)
+      os.utime(temp_path, ns=(0, os.stat(temp_path).st_mtime_ns + 1))
+
+      reloaded = config.load_config(temp_path)
+      self.assertIsNot(reloaded, cfg)
+      self.assertEqual(reloaded.openai.api_key, "second_key")
+    finally:
+      os.unlink(temp_path)
+
+  def test_load_config_reuses_parse_of_unchanged_contents(self):
+    """Test touching a config file without changing it skips re-parsing."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+      json.dump({"openai": {"api_key": "openai_key"}}, f)
+      temp_path = f.name
+
+    try:
+      cfg = config.load_config(temp_path)
+      os.utime(temp_path, ns=(0, os.stat(temp_path).st_mtime_ns + 1))
+      self.assertIs(config.load_config(temp_path), cfg)
+    finally:
+      os.unlink(temp_path)
 
   def test_get_api_key_with_fallback_config_key(self):
     """Test get_api_key_with_fallback returns config_key when provided."""
@@ -148,48 +319,104 @@ class ConfigTest(absltest.TestCase):
 
   def test_get_api_key_with_fallback_env_var(self):
     """Test get_api_key_with_fallback returns environment variable."""
-    with mock.patch('os.environ.get', return_value="env_key"), \
+    with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "env_key"}), \
          mock.patch('game_arena.harness.config.load_config') as mock_load_config:
+      config.invalidate_env_cache()
       mock_load_config.return_value = config.Config()
       result = config.get_api_key_with_fallback(None, "OPENAI_API_KEY")
       self.assertEqual(result, "env_key")
+      # A set environment variable skips loading the default config.
+      mock_load_config.assert_not_called()
+
+  def test_get_api_key_with_fallback_env_var_set_after_import(self):
+    """Test env vars missing from the snapshot are read from os.environ."""
+    with mock.patch.dict(os.environ, {"OPENAI_API_KEY": ""}):
+      config.invalidate_env_cache()
+      os.environ["OPENAI_API_KEY"] = "late_key"
+      self.assertEqual(
+          config.get_api_key_with_fallback(None, "OPENAI_API_KEY"), "late_key"
+      )
+      self.assertEqual(
+          config.get_api_key_with_fallback(
+              None, "OPENAI_API_KEY", config.Config()
+          ),
+          "late_key",
+      )
+
+  @mock.patch('game_arena.harness.config.load_config')
+  def test_get_api_key_with_fallback_reads_environ_once(self, mock_load_config):
+    """Test an unset env var is looked up once when no config is passed."""
+    mock_load_config.return_value = config.Config()
+    with mock.patch.dict(os.environ, {"OPENAI_API_KEY": ""}):
+      config.invalidate_env_cache()
+      with mock.patch.object(
+          os.environ, 'get', wraps=os.environ.get
+      ) as mock_get:
+        result = config.get_api_key_with_fallback(None, "OPENAI_API_KEY")
+    self.assertFalse(result)
+    mock_get.assert_called_once_with("OPENAI_API_KEY")
+
+  def test_get_api_key_with_fallback_explicit_config_beats_env_var(self):
+    """Test an explicitly passed config takes precedence over the env var."""
+    test_config = config.Config(openai=config.LLMConfig(api_key="config_key"))
+    with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "env_key"}):
+      config.invalidate_env_cache()
+      result = config.get_api_key_with_fallback(
+          None, "OPENAI_API_KEY", test_config
+      )
+      self.assertEqual(result, "config_key")
+
+  def test_get_api_key_with_fallback_uses_env_snapshot(self):
+    """Test env var changes are only seen after invalidate_env_cache."""
+    test_config = config.Config()
+    with mock.patch.dict(os.environ, {"XAI_API_KEY": "old_key"}):
+      config.invalidate_env_cache()
+      os.environ["XAI_API_KEY"] = "new_key"
+      self.assertEqual(
+          config.get_api_key_with_fallback(None, "XAI_API_KEY", test_config),
+          "old_key",
+      )
+      config.invalidate_env_cache()
+      self.assertEqual(
+          config.get_api_key_with_fallback(None, "XAI_API_KEY", test_config),
+          "new_key",
+      )
 
   def test_get_api_key_with_fallback_config_provider(self):
     """Test get_api_key_with_fallback returns config provider key."""
-    test_config = config.Config()
-    test_config.openai.api_key = "config_key"
+    test_config = config.Config(openai=config.LLMConfig(api_key="config_key"))
     
     result = config.get_api_key_with_fallback(None, "OPENAI_API_KEY", test_config)
     self.assertEqual(result, "config_key")
 
   def test_get_api_key_with_fallback_anthropic(self):
     """Test get_api_key_with_fallback works for Anthropic."""
-    test_config = config.Config()
-    test_config.anthropic.api_key = "anthropic_key"
+    test_config = config.Config(
+        anthropic=config.LLMConfig(api_key="anthropic_key")
+    )
     
     result = config.get_api_key_with_fallback(None, "ANTHROPIC_API_KEY", test_config)
     self.assertEqual(result, "anthropic_key")
 
   def test_get_api_key_with_fallback_gemini(self):
     """Test get_api_key_with_fallback works for Gemini."""
-    test_config = config.Config()
-    test_config.gemini.api_key = "gemini_key"
+    test_config = config.Config(gemini=config.LLMConfig(api_key="gemini_key"))
     
     result = config.get_api_key_with_fallback(None, "GOOGLE_API_KEY", test_config)
     self.assertEqual(result, "gemini_key")
 
   def test_get_api_key_with_fallback_together(self):
     """Test get_api_key_with_fallback works for Together."""
-    test_config = config.Config()
-    test_config.together.api_key = "together_key"
+    test_config = config.Config(
+        together=config.LLMConfig(api_key="together_key")
+    )
     
     result = config.get_api_key_with_fallback(None, "TOGETHER_API_KEY", test_config)
     self.assertEqual(result, "together_key")
 
   def test_get_api_key_with_fallback_xai(self):
     """Test get_api_key_with_fallback works for XAI."""
-    test_config = config.Config()
-    test_config.xai.api_key = "xai_key"
+    test_config = config.Config(xai=config.LLMConfig(api_key="xai_key"))
     
     result = config.get_api_key_with_fallback(None, "XAI_API_KEY", test_config)
     self.assertEqual(result, "xai_key")
@@ -199,17 +426,40 @@ class ConfigTest(absltest.TestCase):
     result = config.get_api_key_with_fallback(None, "NONEXISTENT_KEY")
     self.assertIsNone(result)
 
+  @mock.patch('game_arena.harness.config.load_config')
+  def test_get_api_key_with_fallback_unknown_env_var(self, mock_load_config):
+    """Test env vars without a provider are read from the environment only."""
+    with mock.patch.dict(os.environ, {"OTHER_API_KEY": "other_key"}):
+      result = config.get_api_key_with_fallback(None, "OTHER_API_KEY")
+    self.assertEqual(result, "other_key")
+    mock_load_config.assert_not_called()
+
   @mock.patch('game_arena.harness.config.load_config')
   def test_get_api_key_with_fallback_loads_config(self, mock_load_config):
     """Test get_api_key_with_fallback loads config when not provided."""
-    test_config = config.Config()
-    test_config.openai.api_key = "loaded_key"
+    test_config = config.Config(openai=config.LLMConfig(api_key="loaded_key"))
     mock_load_config.return_value = test_config
     
-    result = config.get_api_key_with_fallback(None, "OPENAI_API_KEY")
+    with mock.patch.dict(os.environ, {"OPENAI_API_KEY": ""}):
+      config.invalidate_env_cache()
+      result = config.get_api_key_with_fallback(None, "OPENAI_API_KEY")
     self.assertEqual(result, "loaded_key")
     mock_load_config.assert_called_once()
 
+  @mock.patch('game_arena.harness.config.load_config')
+  def test_get_default_config_loads_once(self, mock_load_config):
+    """Test the default config is loaded once and shared until reset."""
+    mock_load_config.side_effect = lambda: config.Config()
+
+    cfg = config.get_default_config()
+    self.assertIs(config.get_default_config(), cfg)
+    config.get_api_key_with_fallback(None, "OPENAI_API_KEY")
+    mock_load_config.assert_called_once()
+
+    config.reset_default_config()
+    self.assertIsNot(config.get_default_config(), cfg)
+    self.assertEqual(mock_load_config.call_count, 2)
+
 
 if __name__ == '__main__':
   absltest.main()
\ No newline at end of file